@@ -6,32 +6,128 @@ Project: hospital-performance-dashboard
 """
 
 import os
+import argparse
+import functools
+import itertools
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import openpyxl
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
 from pathlib import Path
 import re
 import sys
+import traceback
 import numpy as np
 
 
+logger = logging.getLogger(__name__)
+
+# Signed integer column types, smallest first, with their value ranges
+INT_TYPES = [
+    ('TINYINT', -2**7, 2**7 - 1),
+    ('SMALLINT', -2**15, 2**15 - 1),
+    ('INT', -2**31, 2**31 - 1),
+]
+
+# Cell strings pandas' read_excel treats as missing by default (its na_values),
+# applied to streamed sheets so both read paths produce the same NULLs
+NA_STRINGS = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+}
+
+# Characters not allowed in unquoted MySQL identifiers
+_SANITIZE_RE = re.compile(r'[^\w$]')
+
+# SQL column types for the dtypes pandas produces most often from Excel
+SQL_TYPES = {
+    np.dtype('int64'): 'BIGINT',
+    np.dtype('int32'): 'BIGINT',
+    np.dtype('float64'): 'DOUBLE',
+    np.dtype('float32'): 'DOUBLE',
+    np.dtype('bool'): 'BOOLEAN',
+    np.dtype('datetime64[ns]'): 'DATETIME',
+    np.dtype('object'): 'TEXT',
+}
+
+# Known column types per file (keyed by lower-case file stem), passed to the
+# Excel reader so these columns skip type inference. fees/discount are left
+# out for Appointment because misaligned rows carry text in those columns.
+SCHEMA_HINTS = {
+    'appointment': {
+        'appointment_id': 'str',
+        'patient_id': 'str',
+        'doctor_id': 'str',
+        'status': 'str',
+        'reason': 'str',
+        'notes': 'str',
+        'suggest': 'str',
+        'payment_method': 'str',
+        'diagnosis': 'str',
+    },
+}
+
+
 class ExcelToMySQL:
     
-    def __init__(self, host='localhost', user='root', password='', database='database_db'):
+    # Rows sent per multi-row INSERT statement
+    INSERT_CHUNKSIZE = 1000
+    
+    # Most placeholders MySQL accepts in one prepared statement
+    MAX_PREPARED_PARAMS = 65535
+    
+    # .xlsx files at least this large are streamed in row chunks of STREAM_CHUNKSIZE
+    STREAM_MIN_FILE_SIZE = 50 * 1024 * 1024
+    STREAM_CHUNKSIZE = 5000
+    
+    def __init__(self, host='localhost', user='root', password='', database='database_db',
+                 debug=False, schema_hints=None):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.debug = debug
+        if debug:
+            self._enable_debug_logging()
+        self.schema_hints = SCHEMA_HINTS if schema_hints is None else schema_hints
         self.connection = None
+        self._cursor = None
+        self._insert_cursor = None
+        self.max_allowed_packet = None
         
+    @staticmethod
+    def _enable_debug_logging():
+        """Send this module's DEBUG output to stderr without touching other loggers"""
+        # Runs in every process that builds an importer, including spawned workers
+        logger.setLevel(logging.DEBUG)
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("    DEBUG: %(message)s"))
+            logger.addHandler(handler)
+    
     def connect(self):
         try:
             self.connection = mysql.connector.connect(
                 host=self.host,
                 user=self.user,
-                password=self.password
+                password=self.password,
+                # Only the temp directory holding our load files may be read by the server
+                allow_local_infile_in_path=tempfile.gettempdir(),
+                use_pure=not mysql.connector.HAVE_CEXT
             )
             if self.connection.is_connected():
+                self.connection.autocommit = False
+                # Shared for the whole session; buffered so a failed read can't leave unread rows
+                self._cursor = self.connection.cursor(buffered=True)
+                # Prepared so multi-row INSERTs are parsed once and then only bound
+                self._insert_cursor = self.connection.cursor(prepared=True)
+                # Server closes the connection on oversized packets, so size INSERTs up front
+                self._cursor.execute("SELECT @@max_allowed_packet")
+                self.max_allowed_packet = int(self._cursor.fetchone()[0])
                 db_info = self.connection.get_server_info()
                 print(f"✓ Connected to MySQL Server version {db_info}")
                 self._create_database()
@@ -46,24 +142,34 @@ class ExcelToMySQL:
     
     def _create_database(self):
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor
             cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
             cursor.execute(f"USE {self.database}")
             print(f"✓ Using database: {self.database}")
-            cursor.close()
         except Error as e:
             print(f"✗ Error creating database: {e}")
             raise
     
-    def sanitize_name(self, name):
-        name = name.replace(' ', '_')
-        name = re.sub(r'[^\w$]', '_', name)
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def sanitize_name(name):
+        name = _SANITIZE_RE.sub('_', name)
         name = name.strip('_')
         if name and name[0].isdigit():
             name = '_' + name
         return name[:64]
     
-    def get_sql_type(self, dtype):
+    @staticmethod
+    def sanitize_columns(columns):
+        """Sanitize a whole set of column names with the same rules as table names"""
+        return [ExcelToMySQL.sanitize_name(col) for col in map(str, columns)]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def get_sql_type(dtype):
+        if dtype in SQL_TYPES:
+            return SQL_TYPES[dtype]
+        
         if pd.api.types.is_integer_dtype(dtype):
             return 'BIGINT'
         elif pd.api.types.is_float_dtype(dtype):
@@ -75,14 +181,41 @@ class ExcelToMySQL:
         else:
             return 'TEXT'
     
-    def create_table_from_dataframe(self, df, table_name):
-        cursor = self.connection.cursor()
+    def get_narrow_sql_type(self, series):
+        """Pick the smallest SQL type that holds the column's actual values"""
+        sql_type = self.get_sql_type(series.dtype)
+        if sql_type not in ('BIGINT', 'DOUBLE'):
+            return sql_type
+        
+        values = series.dropna().to_numpy(dtype=np.float64)
+        if len(values) == 0:
+            return sql_type
+        
+        # Whole-number floats (integer columns with blanks) can use integer types
+        if sql_type == 'BIGINT' or (np.isfinite(values).all() and (values == np.round(values)).all()):
+            mn, mx = values.min(), values.max()
+            for int_type, low, high in INT_TYPES:
+                if low <= mn and mx <= high:
+                    return int_type
+            return sql_type
+        
+        # Money-like values with exactly two decimals or fewer fit an exact DECIMAL;
+        # float artifacts like 0.1 + 0.2 fail the exact check and stay DOUBLE
+        if (np.round(values, 2) == values).all() and np.abs(values).max() < 1e8:
+            return 'DECIMAL(10,2)'
+        
+        return sql_type
+    
+    def create_table_from_dataframe(self, df, table_name, sanitized_cols, all_text=False):
+        cursor = self._cursor
         cursor.execute(f"DROP TABLE IF EXISTS `{table_name}`")
         
         columns = []
-        for col in df.columns:
-            col_name = self.sanitize_name(str(col))
-            col_type = self.get_sql_type(df[col].dtype)
+        for col_name, (_, series) in zip(sanitized_cols, df.items()):
+            if all_text:
+                col_type = 'TEXT'
+            else:
+                col_type = self.get_narrow_sql_type(series)
             columns.append(f"`{col_name}` {col_type}")
         
         create_table_query = f"""
@@ -93,7 +226,6 @@ class ExcelToMySQL:
         """
         
         cursor.execute(create_table_query)
-        cursor.close()
         print(f"  ✓ Created table: {table_name}")
     
     def fix_dataframe_structure(self, df):
@@ -104,9 +236,10 @@ class ExcelToMySQL:
         if 'patient_test_id' in df.columns and 'discount' in df.columns:
             print("    ⚙ Found Patient_Tests table. Data is already correctly formatted.")
             
-            null_count = df['discount'].isna().sum()
-            zero_count = (df['discount'] == 0).sum()
-            print(f"    📊 Discount column: {null_count} NULL values, {zero_count} zero values")
+            if self.debug:
+                null_count = df['discount'].isna().sum()
+                zero_count = (df['discount'] == 0).sum()
+                logger.debug(f"Discount column: {null_count} NULL values, {zero_count} zero values")
             
             return df
         
@@ -121,136 +254,283 @@ class ExcelToMySQL:
             current_cols = list(df.columns)
             
             if 'appointment_id' in current_cols and 'diagnosis' in current_cols:
-                problematic_rows = df[pd.to_numeric(df['suggest'], errors='coerce').notna()]
+                mask = pd.to_numeric(df['suggest'], errors='coerce').notna().to_numpy()
+                misaligned = int(mask.sum())
                 
-                if len(problematic_rows) > 0:
-                    print(f"    ⚠ Found {len(problematic_rows)} misaligned rows. Fixing...")
+                if misaligned > 0:
+                    print(f"    ⚠ Found {misaligned} misaligned rows. Fixing...")
                     
-                    df_fixed = df.copy()
-                    mask = pd.to_numeric(df_fixed['suggest'], errors='coerce').notna()
+                    # Shift suggest/fees/payment_method one column right in a single block
+                    shift_cols = ['suggest', 'fees', 'payment_method', 'discount']
+                    col_idx = [df.columns.get_loc(col) for col in shift_cols]
+                    block = df[shift_cols].to_numpy(dtype=object)[mask]
                     
-                    suggest_vals = df_fixed.loc[mask, 'suggest'].copy()
-                    fees_vals = df_fixed.loc[mask, 'fees'].copy()
-                    payment_vals = df_fixed.loc[mask, 'payment_method'].copy()
-                    discount_vals = df_fixed.loc[mask, 'discount'].copy()
-                    diagnosis_vals = df_fixed.loc[mask, 'diagnosis'].copy()
+                    shifted = np.empty_like(block)
+                    shifted[:, 0] = np.nan
+                    shifted[:, 1] = pd.to_numeric(block[:, 0], errors='coerce')
+                    shifted[:, 2] = block[:, 1]
+                    shifted[:, 3] = pd.to_numeric(block[:, 2], errors='coerce')
                     
-                    df_fixed.loc[mask, 'suggest'] = np.nan
-                    df_fixed.loc[mask, 'fees'] = pd.to_numeric(suggest_vals, errors='coerce')
-                    df_fixed.loc[mask, 'payment_method'] = fees_vals
-                    df_fixed.loc[mask, 'discount'] = pd.to_numeric(payment_vals, errors='coerce')
+                    df_fixed = df.copy()
+                    df_fixed.iloc[mask, col_idx] = shifted
                     
-                    print(f"    ✓ Fixed {len(problematic_rows)} misaligned rows")
+                    print(f"    ✓ Fixed {misaligned} misaligned rows")
                     return df_fixed
         
         return df
     
-    def insert_dataframe(self, df, table_name):
-        cursor = self.connection.cursor()
+    def insert_dataframe(self, df, table_name, sanitized_cols):
+        cursor = self._cursor
         
-        df_clean = df.copy()
+        # Convert DataFrame to list of tuples, replacing NaN/NaT with None.
+        # Conversions are written into the array so df is neither copied nor modified.
+        arr = df.to_numpy(dtype=object, copy=True)
         
-        # Convert date and time columns properly
+        # Convert date and time columns to native date/time objects
         date_cols = ['appointment_date', 'test_date', 'result_date']
         time_cols = ['appointment_time']
         
-        for col in df_clean.columns:
-            # Handle dates
-            if col in date_cols:
-                try:
-                    df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
-                    df_clean[col] = df_clean[col].dt.strftime('%Y-%m-%d')
-                except:
-                    pass
-            
-            # Handle times  
-            elif col in time_cols:
-                try:
-                    df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
-                    df_clean[col] = df_clean[col].dt.strftime('%H:%M:%S')
-                except:
-                    pass
-            
-            # Handle other datetime columns
-            elif pd.api.types.is_datetime64_any_dtype(df_clean[col]):
-                df_clean[col] = df_clean[col].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Convert DataFrame to list of tuples and replace NaN with None
-        data = []
-        for _, row in df_clean.iterrows():
-            # Convert each value, replacing NaN/NaT with None
-            cleaned_row = []
-            for val in row:
-                if pd.isna(val):
-                    cleaned_row.append(None)
-                else:
-                    cleaned_row.append(val)
-            data.append(tuple(cleaned_row))
+        for col in df.columns.intersection(date_cols):
+            try:
+                arr[:, df.columns.get_loc(col)] = pd.to_datetime(df[col], errors='coerce').dt.date
+            except:
+                pass
+        
+        for col in df.columns.intersection(time_cols):
+            try:
+                arr[:, df.columns.get_loc(col)] = pd.to_datetime(df[col], errors='coerce').dt.time
+            except:
+                pass
+        
+        # Other datetime columns are bound as datetime.datetime instead of formatted strings
+        datetime_cols = df.select_dtypes(include=['datetime', 'datetimetz']).columns
+        for col in datetime_cols.difference(date_cols + time_cols):
+            arr[:, df.columns.get_loc(col)] = df[col].array.to_pydatetime()
+        
+        arr[pd.isna(arr)] = None
+        data = arr.tolist()
         
         # Prepare for insertion
-        sanitized_cols = [self.sanitize_name(str(col)) for col in df_clean.columns]
-        placeholders = ', '.join(['%s'] * len(sanitized_cols))
         columns_str = ', '.join([f"`{col}`" for col in sanitized_cols])
         
-        insert_query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-        
+        inserted = len(data)
         try:
-            cursor.executemany(insert_query, data)
+            # Load the whole table in one transaction with InnoDB checks relaxed
+            cursor.execute("SET SESSION unique_checks=0")
+            cursor.execute("SET SESSION foreign_key_checks=0")
+            cursor.execute("START TRANSACTION")
+            
+            try:
+                inserted = self._load_data_infile(cursor, table_name, columns_str, data)
+            except Error as e:
+                # Server refuses LOCAL INFILE - fall back to multi-row INSERT
+                if e.errno not in (errorcode.ER_NOT_ALLOWED_COMMAND,
+                                   errorcode.ER_CLIENT_LOCAL_FILES_DISABLED):
+                    raise
+                print("  ⚠ LOAD DATA LOCAL INFILE not permitted, using INSERT")
+                self._insert_rows(self._insert_cursor, table_name, columns_str,
+                                  len(sanitized_cols), data)
             self.connection.commit()
-            print(f"  ✓ Inserted {len(data)} rows into {table_name}")
+            print(f"  ✓ Inserted {inserted} rows into {table_name}")
             
             # Show count of NULL values in discount column if it exists
-            if 'discount' in df.columns:
+            if self.debug and 'discount' in df.columns:
                 null_count = df['discount'].isna().sum()
                 zero_count = (df['discount'] == 0).sum()
-                print(f"  📊 Discount column stats: {null_count} NULL values, {zero_count} zero values")
+                logger.debug(f"Discount column stats: {null_count} NULL values, {zero_count} zero values")
                 
         except Error as e:
             print(f"  ✗ Error inserting data: {e}")
             print(f"  First problematic row: {data[0] if data else 'No data'}")
             self.connection.rollback()
             raise
+        finally:
+            if self.connection.is_connected():
+                cursor.execute("SET SESSION unique_checks=1")
+                cursor.execute("SET SESSION foreign_key_checks=1")
+    
+    def _to_infile_field(self, val):
+        """Encode a value in MySQL's default LOAD DATA text format"""
+        if val is None:
+            return '\\N'
+        if isinstance(val, (bool, np.bool_)):
+            return '1' if val else '0'
+        return (str(val).replace('\\', '\\\\')
+                        .replace('\t', '\\t')
+                        .replace('\n', '\\n')
+                        .replace('\r', '\\r'))
+    
+    def _load_data_infile(self, cursor, table_name, columns_str, data):
+        """Bulk load rows through a temporary tab-separated file, return rows loaded"""
+        tmp = tempfile.NamedTemporaryFile(mode='w', suffix='.tsv', encoding='utf-8',
+                                          newline='', delete=False,
+                                          dir=tempfile.gettempdir())
+        try:
+            with tmp:
+                for row in data:
+                    tmp.write('\t'.join(self._to_infile_field(val) for val in row))
+                    tmp.write('\n')
+            
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table_name}` "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' ({columns_str})",
+                (tmp.name,)
+            )
+        finally:
+            os.unlink(tmp.name)
+        
+        # LOAD DATA LOCAL implies IGNORE - bad values only show up as warnings
+        loaded = cursor.rowcount
+        warnings = cursor.warning_count
+        if warnings or loaded != len(data):
+            first_warning = ''
+            if warnings:
+                cursor.execute("SHOW WARNINGS LIMIT 1")
+                first_warning = f" (first: {cursor.fetchone()[2]})"
+            raise mysql.connector.errors.DataError(
+                msg=f"LOAD DATA loaded {loaded}/{len(data)} rows with "
+                    f"{warnings} warning(s){first_warning}"
+            )
+        return loaded
+    
+    def _insert_rows(self, cursor, table_name, columns_str, ncols, data):
+        """Insert rows using multi-row VALUES statements, one round-trip per chunk"""
+        row_placeholders = "(" + ", ".join(["%s"] * ncols) + ")"
+        # Prepared statements are capped at MAX_PREPARED_PARAMS placeholders
+        chunksize = max(1, min(self.INSERT_CHUNKSIZE, self.MAX_PREPARED_PARAMS // ncols))
         
-        cursor.close()
+        for chunk in self._packet_sized_chunks(data, chunksize, len(row_placeholders)):
+            insert_query = (
+                f"INSERT INTO `{table_name}` ({columns_str}) VALUES "
+                + ", ".join([row_placeholders] * len(chunk))
+            )
+            cursor.execute(insert_query, list(itertools.chain.from_iterable(chunk)))
+    
+    def _packet_sized_chunks(self, data, chunksize, row_overhead):
+        """Split rows into chunks of at most chunksize rows that fit max_allowed_packet"""
+        # Leave headroom for the statement text and protocol framing
+        budget = self.max_allowed_packet * 0.9 - 64 * 1024
+        chunk = []
+        chunk_bytes = 0
+        
+        for row in data:
+            # Rough wire size: encoded value plus a few bytes of type/length header each
+            row_bytes = row_overhead + sum(
+                8 if val is None else len(str(val).encode('utf-8')) + 8 for val in row
+            )
+            if chunk and (len(chunk) >= chunksize or chunk_bytes + row_bytes > budget):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(row)
+            chunk_bytes += row_bytes
+        
+        if chunk:
+            yield chunk
+    
+    def _open_workbook(self, file_path):
+        """Open a workbook with the fastest available engine"""
+        # calamine streams the sheet XML instead of building an openpyxl DOM
+        for engine in ('calamine', 'openpyxl'):
+            try:
+                return pd.ExcelFile(file_path, engine=engine)
+            except Exception:
+                continue
+        return pd.ExcelFile(file_path)
+    
+    def _should_stream(self, file_path):
+        return (Path(file_path).suffix.lower() in ('.xlsx', '.xlsm')
+                and os.path.getsize(file_path) >= self.STREAM_MIN_FILE_SIZE)
+    
+    def _iter_sheet_chunks(self, worksheet):
+        """Yield a read-only worksheet as DataFrames of STREAM_CHUNKSIZE rows"""
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        # Name blank and repeated headers the way pandas does ('Unnamed: 3', 'a.1')
+        columns = []
+        seen = {}
+        for i, col in enumerate(header):
+            col = f"Unnamed: {i}" if col is None else col
+            if col in seen:
+                seen[col] += 1
+                col = f"{col}.{seen[col]}"
+            else:
+                seen[col] = 0
+            columns.append(col)
+        
+        chunk = []
+        for row in rows:
+            row = tuple(None if isinstance(val, str) and val in NA_STRINGS else val
+                        for val in row)
+            # Skip blank rows so trailing formatting doesn't become NULL rows
+            if all(val is None for val in row):
+                continue
+            chunk.append(row)
+            if len(chunk) >= self.STREAM_CHUNKSIZE:
+                yield pd.DataFrame(chunk, columns=columns)
+                chunk = []
+        
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns)
     
     def import_excel_file(self, file_path):
+        excel_file = None
         try:
             file_name = Path(file_path).stem
             print(f"\n📊 Processing: {Path(file_path).name}")
-            print(f"  Full path: {file_path}")
+            if self.debug:
+                logger.debug(f"Full path: {file_path}")
             
-            try:
-                excel_file = pd.ExcelFile(file_path, engine='openpyxl')
-            except:
-                excel_file = pd.ExcelFile(file_path)
-                
-            sheets = excel_file.sheet_names
+            stream = self._should_stream(file_path)
+            if stream:
+                # Large workbook - read rows lazily instead of loading whole sheets
+                excel_file = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+                # worksheets skips chart sheets, which have no rows to read
+                sheets = [worksheet.title for worksheet in excel_file.worksheets]
+                print(f"  ⚙ Streaming in chunks of {self.STREAM_CHUNKSIZE} rows")
+            else:
+                excel_file = self._open_workbook(file_path)
+                sheets = excel_file.sheet_names
+            
+            dtype = self.schema_hints.get(file_name.lower())
             print(f"  Found {len(sheets)} sheet(s): {sheets}")
             
             file_has_data = False
+            file_failed = False
             
             for sheet_name in sheets:
                 print(f"\n  ── Analyzing sheet: '{sheet_name}' ──")
                 
-                try:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
-                except:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name)
+                if stream:
+                    chunks = self._iter_sheet_chunks(excel_file[sheet_name])
+                else:
+                    # Reuse the already-opened workbook instead of re-reading the file
+                    chunks = iter([excel_file.parse(sheet_name, dtype=dtype)])
+                
+                df = next(chunks, pd.DataFrame())
                 
-                print(f"    DataFrame shape: {df.shape}")
-                print(f"    DataFrame empty? {df.empty}")
-                print(f"    Columns ({len(df.columns)}): {list(df.columns)}")
+                if self.debug:
+                    logger.debug(f"DataFrame shape: {df.shape}")
+                    logger.debug(f"Columns ({len(df.columns)}): {list(df.columns)}")
                 
                 if df.empty:
                     print(f"    ⚠ DataFrame is completely empty")
                     continue
                 
-                non_empty_rows = df.dropna(how='all').shape[0]
+                non_empty_rows = int((~df.isna().all(axis=1)).sum())
                 if non_empty_rows == 0:
                     print(f"    ⚠ DataFrame has only NaN/empty values")
                     continue
                 
-                print(f"    Rows with data: {non_empty_rows}/{df.shape[0]}")
+                if stream:
+                    print(f"    Rows with data (first chunk): {non_empty_rows}/{df.shape[0]}")
+                else:
+                    print(f"    Rows with data: {non_empty_rows}/{df.shape[0]}")
                 
                 if file_name.lower() in ['appointment', 'patient_tests']:
                     df = self.fix_dataframe_structure(df)
@@ -264,28 +544,50 @@ class ExcelToMySQL:
                 
                 print(f"    Creating table: {table_name}")
                 
+                sanitized_cols = self.sanitize_columns(df.columns)
+                
                 try:
-                    self.create_table_from_dataframe(df, table_name)
-                    self.insert_dataframe(df, table_name)
+                    # A streamed sheet's first chunk doesn't tell us the later chunks'
+                    # types, so its columns are all TEXT and no value gets coerced
+                    self.create_table_from_dataframe(df, table_name, sanitized_cols,
+                                                     all_text=stream)
+                    self.insert_dataframe(df, table_name, sanitized_cols)
+                    
+                    # Remaining chunks of a streamed sheet go into the same table
+                    total_rows = df.shape[0]
+                    for chunk in chunks:
+                        if file_name.lower() in ['appointment', 'patient_tests']:
+                            chunk = self.fix_dataframe_structure(chunk)
+                        self.insert_dataframe(chunk, table_name, sanitized_cols)
+                        total_rows += chunk.shape[0]
+                    
+                    if stream:
+                        print(f"    Rows with data: {total_rows} streamed into {table_name}")
                 except Exception as e:
                     print(f"    ✗ Error processing table {table_name}: {e}")
-                    import traceback
                     traceback.print_exc()
+                    file_failed = True
+                    if stream:
+                        # Earlier chunks are already committed - don't leave a partial table
+                        self._cursor.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+                        print(f"    ✗ Dropped partially loaded table: {table_name}")
                     continue
             
             if not file_has_data:
                 print(f"\n  ⚠ File '{Path(file_path).name}' contains no usable data.")
                 return None
             
-            return True
+            return not file_failed
             
         except Exception as e:
             print(f"  ✗ Error processing {Path(file_path).name}: {e}")
-            import traceback
             traceback.print_exc()
             return False
+        finally:
+            if excel_file is not None:
+                excel_file.close()
     
-    def import_folder(self, folder_path):
+    def import_folder(self, folder_path, workers=1):
         folder = Path(folder_path)
         
         if not folder.exists():
@@ -302,12 +604,30 @@ class ExcelToMySQL:
         
         print(f"\n📁 Found {len(excel_files)} Excel file(s) in '{folder_path}'")
         
+        workers = min(workers, os.cpu_count() or 1, len(excel_files))
+        
+        if workers > 1:
+            # Each worker process imports whole files over its own connection
+            print(f"⚙ Importing with {workers} worker processes")
+            mysql_config = {
+                'host': self.host,
+                'user': self.user,
+                'password': self.password,
+                'database': self.database,
+                'debug': self.debug,
+                'schema_hints': self.schema_hints
+            }
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(import_file_worker, excel_files,
+                                            itertools.repeat(mysql_config)))
+        else:
+            results = [self.import_excel_file(file_path) for file_path in excel_files]
+        
         successful = 0
         failed = 0
         empty = 0
         
-        for file_path in excel_files:
-            result = self.import_excel_file(file_path)
+        for result in results:
             if result is True:
                 successful += 1
             elif result is False:
@@ -326,7 +646,7 @@ class ExcelToMySQL:
     
     def list_tables(self):
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor
             cursor.execute("SHOW TABLES")
             tables = cursor.fetchall()
             
@@ -346,8 +666,7 @@ class ExcelToMySQL:
                     if count > 0:
                         cursor.execute(f"SELECT * FROM `{table[0]}` LIMIT 3")
                         sample_rows = cursor.fetchall()
-                        cursor.execute(f"DESCRIBE `{table[0]}`")
-                        column_names = [col[0] for col in cursor.fetchall()]
+                        column_names = [col[0] for col in columns]
                         print(f"     Sample data (first 3 rows):")
                         for row in sample_rows:
                             row_dict = {}
@@ -356,18 +675,39 @@ class ExcelToMySQL:
                             print(f"       {row_dict}")
             else:
                 print(f"\n📋 No tables found in database '{self.database}'")
-            
-            cursor.close()
         except Error as e:
             print(f"✗ Error listing tables: {e}")
     
     def close(self):
         if self.connection and self.connection.is_connected():
+            for cursor in (self._cursor, self._insert_cursor):
+                if cursor is not None:
+                    cursor.close()
+            self._cursor = None
+            self._insert_cursor = None
             self.connection.close()
             print("✓ MySQL connection closed")
 
 
+def import_file_worker(file_path, mysql_config):
+    """Import a single Excel file in a worker process with its own connection"""
+    importer = ExcelToMySQL(**mysql_config)
+    if not importer.connect():
+        return False
+    try:
+        return importer.import_excel_file(file_path)
+    finally:
+        importer.close()
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Import Excel files into MySQL")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of files to import in parallel (default: 1)")
+    parser.add_argument('--debug', action='store_true',
+                        help="log DataFrame diagnostics while importing")
+    args = parser.parse_args()
+    
     print("\n" + "="*60)
     print("HOSPITAL PERFORMANCE DASHBOARD - Excel to MySQL Importer")
     print("="*60)
@@ -384,10 +724,10 @@ def main():
     
     print("\n" + "="*60)
     
-    importer = ExcelToMySQL(**MYSQL_CONFIG)
+    importer = ExcelToMySQL(**MYSQL_CONFIG, debug=args.debug)
     
     if importer.connect():
-        importer.import_folder(DATASET_FOLDER)
+        importer.import_folder(DATASET_FOLDER, workers=args.workers)
         importer.list_tables()
         importer.close()
         